@@ -72,20 +72,26 @@ def _fielding_core_numpy(
     mask = np.zeros_like(Sv, dtype=bool)  # True = BAD
     mask_ = np.zeros_like(Sv, dtype=bool)  # True = "uncomputable" ping
 
+    # pings with no finite Sv in the detection window, found once for all pings
+    empty_ping = np.isnan(Sv[up:lw]).all(axis=0)
+
+    # linear Sv, converted once; only rows above `lw` are ever read below
+    Sv_lin = _log2lin(Sv[:lw])
+
     n_pings = Sv.shape[1]
     for j in range(start, n_pings):
-        if (j - n < 0) or (j + n > n_pings - 1) or np.all(np.isnan(Sv[up:lw, j])):
+        if (j - n < 0) or (j + n > n_pings - 1) or empty_ping[j]:
             mask_[:, j] = True
         else:
-            pingmedian = _lin2log(np.nanmedian(_log2lin(Sv[up:lw, j])))
-            pingp75 = _lin2log(np.nanpercentile(_log2lin(Sv[up:lw, j]), 75))
-            blockmedian = _lin2log(np.nanmedian(_log2lin(Sv[up:lw, j - n : j + n])))
+            pingmedian = _lin2log(np.nanmedian(Sv_lin[up:lw, j]))
+            pingp75 = _lin2log(np.nanpercentile(Sv_lin[up:lw, j], 75))
+            blockmedian = _lin2log(np.nanmedian(Sv_lin[up:lw, j - n : j + n]))
 
             if (pingp75 < maxts) and ((pingmedian - blockmedian) > thr[0]):
                 r0_, r1_ = up - sf, up
                 while r0_ > rmin:
-                    pingmedian = _lin2log(np.nanmedian(_log2lin(Sv[r0_:r1_, j])))
-                    blockmedian = _lin2log(np.nanmedian(_log2lin(Sv[r0_:r1_, j - n : j + n])))
+                    pingmedian = _lin2log(np.nanmedian(Sv_lin[r0_:r1_, j]))
+                    blockmedian = _lin2log(np.nanmedian(Sv_lin[r0_:r1_, j - n : j + n]))
                     r0_, r1_ = r0_ - sf, r1_ - sf
                     if (pingmedian - blockmedian) < thr[1]:
                         break
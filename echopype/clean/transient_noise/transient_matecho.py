@@ -1,6 +1,6 @@
 import numpy as np
 import xarray as xr
-from scipy.ndimage import binary_dilation
+from scipy.ndimage import binary_dilation, minimum_filter1d
 
 from echopype.utils.compute import _lin2log, _log2lin
 
@@ -71,10 +71,15 @@ def _matecho_core_numpy(
 
     pings_bad = np.zeros(n_ping, dtype=bool)
 
+    # Shallowest bottom over each ping's window [j - h, j + h), for all pings at once;
+    # edge padding never changes the minimum since the edge ping is in the clipped window
+    half_window = window_ping // 2
+    local_bottoms = minimum_filter1d(bottom_depth, size=max(2 * half_window, 1), mode="nearest")
+
     for j in range(n_ping):
-        j0 = max(0, j - window_ping // 2)
-        j1 = min(n_ping, j + window_ping // 2)
-        local_bottom = np.min(bottom_depth[j0:j1])
+        j0 = max(0, j - half_window)
+        j1 = min(n_ping, j + half_window)
+        local_bottom = local_bottoms[j]
 
         refined_mask = depth_mask & (r < local_bottom)
         if not np.any(refined_mask):
@@ -133,13 +133,15 @@ def index_binning_pool_Sv(
         depth_bin / np.nanmean(np.diff(ds_Sv[range_var], axis=2), axis=(1, 2))
     ).astype(int)
 
+    # First range sample below `exclude_above`; this does not depend on the channel
+    min_range_sample = np.argmin((ds_Sv[range_var] <= exclude_above).data)
+
     # Create list for pooled Sv DataArrays
     pooled_Sv_list = []
 
     # Iterate through channels
     for channel_index in range(len(ds_Sv["channel"])):
         # Create calibrated Sv DataArray copies and remove values too close to the surface
-        min_range_sample = np.argmin((ds_Sv[range_var] <= exclude_above).data)
         chan_Sv = ds_Sv["Sv"].isel(
             channel=channel_index,
             range_sample=slice(min_range_sample, None),
@@ -345,34 +347,52 @@ def echopy_attenuated_signal_mask(
     """Single-channel attenuated signal mask computation from echopy."""
     # Initialize mask
     attenuated_mask = np.zeros(Sv.shape, dtype=bool)
+    if Sv.shape[0] == 0:
+        return attenuated_mask
+
+    # Find indices for upper and lower SL limits, for all pings at once
+    range_var = np.asarray(range_var)
+    up_idx = np.argmin(abs(range_var - upper_limit_sl), axis=1)
+    lw_idx = np.argmin(abs(range_var - lower_limit_sl), axis=1)
+
+    # Only range samples between the shallowest upper and deepest lower limit are used
+    r0 = int(up_idx.min())
+    r1 = max(int(lw_idx.max()), r0)
+    up_idx = np.minimum(up_idx - r0, r1 - r0)
+    lw_idx = np.maximum(lw_idx - r0, 0)
+    Sv = Sv[:, r0:r1]
+
+    # Mask only where attenuation masking is feasible: the ping has full side blocks and
+    # some non-NaN data between the SL limits (counted for all pings at once)
+    num_pings = Sv.shape[0]
+    ping_idx = np.arange(num_pings)
+    valid_cumsum = np.zeros((num_pings, Sv.shape[1] + 1), dtype=np.int32)
+    np.cumsum(~np.isnan(Sv), axis=1, out=valid_cumsum[:, 1:])
+    has_data = (valid_cumsum[ping_idx, lw_idx] - valid_cumsum[ping_idx, up_idx]) > 0
+    del valid_cumsum
+    feasible = (
+        has_data & (ping_idx - num_side_pings >= 0) & (ping_idx + num_side_pings <= num_pings - 1)
+    )
 
-    for ping_time_idx in range(Sv.shape[0]):
-
-        # Find indices for upper and lower SL limits
-        up = np.argmin(abs(range_var[ping_time_idx, :] - upper_limit_sl).data)
-        lw = np.argmin(abs(range_var[ping_time_idx, :] - lower_limit_sl).data)
-
-        # Mask when attenuation masking is feasible
-        if not (
-            (ping_time_idx - num_side_pings < 0)
-            | (ping_time_idx + num_side_pings > Sv.shape[0] - 1)
-            | np.all(np.isnan(Sv[ping_time_idx, up:lw]))
-        ):
-            # Compare ping and block medians, and mask ping if difference greater than
-            # threshold.
-            pingmedian = _lin2log(np.nanmedian(_log2lin(Sv[ping_time_idx, up:lw])))
-            blockmedian = _lin2log(
-                np.nanmedian(
-                    _log2lin(
-                        Sv[
-                            (ping_time_idx - num_side_pings) : (ping_time_idx + num_side_pings),
-                            up:lw,
-                        ]
-                    )
-                )
+    # Convert to linear once; each ping is reused by the blocks of its neighbours
+    Sv_lin = _log2lin(Sv)
+
+    for ping_time_idx in np.flatnonzero(feasible):
+        up, lw = up_idx[ping_time_idx], lw_idx[ping_time_idx]
+
+        # Compare ping and block medians, and mask ping if difference greater than
+        # threshold.
+        pingmedian = _lin2log(np.nanmedian(Sv_lin[ping_time_idx, up:lw]))
+        blockmedian = _lin2log(
+            np.nanmedian(
+                Sv_lin[
+                    (ping_time_idx - num_side_pings) : (ping_time_idx + num_side_pings),
+                    up:lw,
+                ]
             )
-            if (pingmedian - blockmedian) < attenuation_signal_threshold:
-                attenuated_mask[ping_time_idx, :] = True
+        )
+        if (pingmedian - blockmedian) < attenuation_signal_threshold:
+            attenuated_mask[ping_time_idx, :] = True
 
     return attenuated_mask
 
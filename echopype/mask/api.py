@@ -163,12 +163,15 @@ def _validate_and_collect_mask_input(
             )
 
         # Validate boolean-like values - reject NaN
+        # Load the mask values once (masks opened from file are lazy)
+        mask_vals = mask[mask_ind].values
+
         # First check if there are any NaN values
-        if np.any(np.isnan(mask[mask_ind].values)):
+        if np.any(np.isnan(mask_vals)):
             raise TypeError("Mask cannot contain NaN")
 
         # Get unique values and check if they are boolean-like
-        unique_vals = np.unique(mask[mask_ind].values)
+        unique_vals = np.unique(mask_vals)
 
         # Check if all values are boolean-like (0, 1, True, False)
         if not np.all(np.isin(unique_vals, [0, 1, True, False])):
@@ -177,9 +180,11 @@ def _validate_and_collect_mask_input(
     # Check for the channel dimension consistency
     channel_dim_shapes = set()
     for mask_indiv in mask:
-        if "channel" in mask_indiv.dims:
-            for mask_chan_ind in range(len(mask_indiv["channel"])):
-                channel_dim_shapes.add(mask_indiv.isel(channel=mask_chan_ind).shape)
+        if "channel" in mask_indiv.dims and mask_indiv.sizes["channel"] > 0:
+            # every channel slice has the shape of the non-channel dims; no need to isel
+            channel_dim_shapes.add(
+                tuple(size for dim, size in mask_indiv.sizes.items() if dim != "channel")
+            )
     if len(channel_dim_shapes) > 1:
         raise ValueError("All masks must have the same shape in the 'channel' dimension.")
 
@@ -65,18 +65,17 @@ def bottom_basic(
     Sv_sel, depth_sel = _check_inputs(ds, var_name, channel)
     tmin, tmax = _validate_threshold(threshold)
 
-    depth_ref = depth_sel.isel(ping_time=0)
+    depth_ref = depth_sel.isel(ping_time=0).values
     Sv_sliced = Sv_sel.isel(range_sample=slice(bin_skip_from_surface, None))
     cond = (Sv_sliced > tmin) & (Sv_sliced < tmax)
 
     # Find index of first match along range_sample
     idx = cond.argmax(dim="range_sample") + bin_skip_from_surface  # add back skipped samples
 
-    # Map index to depth using depth_ref
+    # Map index to depth using depth_ref, for all pings at once
     bottom_depth = xr.apply_ufunc(
-        lambda i: depth_ref[int(i)] if np.isfinite(i) else np.nan,
-        idx.astype(float),
-        vectorize=True,
+        lambda i: np.take(depth_ref, i).astype(float),
+        idx,
         dask="parallelized",
         output_dtypes=[float],
     ) - float(
@@ -89,14 +89,13 @@ def bottom_blackwell(
     # parse thresholds
     tSv, ttheta, tphi = _parse_blackwell_thresholds(threshold)
 
-    # Direct selection without using ch_sel
-    theta = ds["angle_alongship"].sel(channel=channel)
-    phi = ds["angle_athwartship"].sel(channel=channel)
-
-    # to match with blackwell echopy format
-    Sv_sel = Sv_sel.transpose("range_sample", "ping_time")
-    theta = theta.transpose("range_sample", "ping_time")
-    phi = phi.transpose("range_sample", "ping_time")
+    # Select the channel once for both angle variables,
+    # in (range_sample, ping_time) order to match with blackwell echopy format
+    angles = (
+        ds[["angle_alongship", "angle_athwartship"]]
+        .sel(channel=channel)
+        .transpose("range_sample", "ping_time", ...)
+    )
 
     ping_time = Sv_sel.coords["ping_time"]
 
@@ -110,9 +109,15 @@ def bottom_blackwell(
     r0_idx = np.nanargmin(abs(r - r0))
     r1_idx = np.nanargmin(abs(r - r1)) + 1
 
-    Svchunk = Sv_sel[r0_idx:r1_idx, :]
-    thetachunk = theta[r0_idx:r1_idx, :]
-    phichunk = phi[r0_idx:r1_idx, :]
+    # Materialize the Sv and angle chunks once; everything below works on NumPy arrays
+    Svchunk = (
+        Sv_sel.isel(range_sample=slice(r0_idx, r1_idx))
+        .transpose("range_sample", "ping_time")
+        .values
+    )
+    angleschunk = angles.isel(range_sample=slice(r0_idx, r1_idx))
+    thetachunk = angleschunk["angle_alongship"].values
+    phichunk = angleschunk["angle_athwartship"].values
 
     # Build angle masks
     ktheta = np.ones((wtheta, wtheta)) / wtheta**2
@@ -126,9 +131,7 @@ def bottom_blackwell(
     # Apply Blackwell algorithm
     if anglemaskchunk.any():
 
-        Svmedian_anglemasked = float(
-            _lin2log(np.nanmedian(_log2lin(Svchunk.values[anglemaskchunk])))
-        )
+        Svmedian_anglemasked = float(_lin2log(np.nanmedian(_log2lin(Svchunk[anglemaskchunk]))))
 
         if np.isnan(Svmedian_anglemasked):
             Svmedian_anglemasked = np.inf
@@ -138,15 +141,13 @@ def bottom_blackwell(
         Svmaskchunk = Svchunk > Svmedian_anglemasked
 
         # Connected components
-        items = ndima.label(Svmaskchunk, ndima.generate_binary_structure(2, 2))[0]
-        intercepted = list(set(items[anglemaskchunk]))
-        if 0 in intercepted:
-            intercepted.remove(0)
+        items, n_items = ndima.label(Svmaskchunk, ndima.generate_binary_structure(2, 2))
+        intercepted = np.zeros(n_items + 1, dtype=bool)
+        intercepted[items[anglemaskchunk]] = True
+        intercepted[0] = False
 
-        # Combine intercepted items
-        maskchunk = np.zeros(Svchunk.shape, dtype=bool)
-        for i in intercepted:
-            maskchunk |= items == i
+        # Combine intercepted items in one lookup over the labels
+        maskchunk = intercepted[items]
 
         # Add padding
         above = np.zeros((r0_idx, maskchunk.shape[1]), dtype=bool)
@@ -155,7 +156,7 @@ def bottom_blackwell(
         mask = np.r_[above, maskchunk, below]
 
     else:
-        mask = np.zeros_like(Sv_sel, dtype=bool)
+        mask = np.zeros((len(r), ping_time.size), dtype=bool)
 
     # Bottom detection from mask - offset
     bottom_sample_idx = mask.argmax(axis=0)
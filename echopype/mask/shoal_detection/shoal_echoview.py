@@ -3,6 +3,9 @@ import pandas as pd
 import scipy.ndimage as ndima
 import xarray as xr
 
+from echopype.mask.shoal_detection.utils import _undersized
+from echopype.utils.compute import _nearest_index
+
 
 def shoal_echoview(
     ds: xr.Dataset,
@@ -86,34 +89,31 @@ def shoal_echoview(
 
     # 2. Remove candidates below mincan size
     candidateslabeled = ndima.label(mask, np.ones((3, 3)))[0]
-    candidateslabels = pd.factorize(candidateslabeled[candidateslabeled != 0])[1]
-    for cl in candidateslabels:
-        candidate = candidateslabeled == cl
-        idx = np.where(candidate)[0]
-        jdx = np.where(candidate)[1]
-        height = idim[max(idx + 1)] - idim[min(idx)]
-        width = jdim[max(jdx + 1)] - jdim[min(jdx)]
-        if (height < mincan[0]) or (width < mincan[1]):
-            mask[idx, jdx] = False
+    mask[_undersized(candidateslabeled, idim, jdim, mincan)[candidateslabeled]] = False
 
     # 3. Linking neighbours
     linked = np.zeros(mask.shape, dtype=int)
     shoalslabeled = ndima.label(mask, np.ones((3, 3)))[0]
     shoalslabels = pd.factorize(shoalslabeled[shoalslabeled != 0])[1]
-    for fl in shoalslabels:
-        shoal = shoalslabeled == fl
-        i0, i1 = np.min(np.where(shoal)[0]), np.max(np.where(shoal)[0])
-        j0, j1 = np.min(np.where(shoal)[1]), np.max(np.where(shoal)[1])
-        i00 = np.nanargmin(abs(idim - (idim[i0] - (maxlink[0] + 1))))
-        i11 = np.nanargmin(abs(idim - (idim[i1] + (maxlink[0] + 1)))) + 1
-        j00 = np.nanargmin(abs(jdim - (jdim[j0] - (maxlink[1] + 1))))
-        j11 = np.nanargmin(abs(jdim - (jdim[j1] + (maxlink[1] + 1)))) + 1
-
-        around = np.zeros_like(mask, dtype=bool)
-        around[i00:i11, j00:j11] = True
-        neighbours = around & mask
-        neighbourlabels = pd.factorize(shoalslabeled[neighbours])[1]
-        neighbourlabels = neighbourlabels[neighbourlabels != 0]
+    # Bounding boxes of all shoals in one pass instead of scanning the mask per shoal
+    shoalsboxes = ndima.find_objects(shoalslabeled)
+    rows = [shoalsboxes[fl - 1][0] for fl in shoalslabels]
+    cols = [shoalsboxes[fl - 1][1] for fl in shoalslabels]
+    i0 = np.array([r.start for r in rows], dtype=int)
+    i1 = np.array([r.stop - 1 for r in rows], dtype=int)
+    j0 = np.array([c.start for c in cols], dtype=int)
+    j1 = np.array([c.stop - 1 for c in cols], dtype=int)
+
+    # Linking boxes expanded by `maxlink`, looked up for all shoals at once
+    i00 = _nearest_index(idim, idim[i0] - (maxlink[0] + 1))
+    i11 = _nearest_index(idim, idim[i1] + (maxlink[0] + 1)) + 1
+    j00 = _nearest_index(jdim, jdim[j0] - (maxlink[1] + 1))
+    j11 = _nearest_index(jdim, jdim[j1] + (maxlink[1] + 1)) + 1
+
+    for k in range(len(shoalslabels)):
+        # Labels found within the linking box, read from the existing label image
+        around = shoalslabeled[i00[k] : i11[k], j00[k] : j11[k]]
+        neighbourlabels = pd.factorize(around[around != 0])[1]
         neighbours = np.isin(shoalslabeled, neighbourlabels)
 
         if (pd.factorize(linked[neighbours])[1] == 0).all():
@@ -126,14 +126,7 @@ def shoal_echoview(
                 linked[linked == fl] = minlabel
 
     # 4. Remove linked shoals smaller than minsho
-    linkedlabels = pd.factorize(linked[linked != 0])[1]
-    for ll in linkedlabels:
-        shoal = linked == ll
-        idx, jdx = np.where(shoal)
-        height = idim[max(idx + 1)] - idim[min(idx)]
-        width = jdim[max(jdx + 1)] - jdim[min(jdx)]
-        if (height < minsho[0]) or (width < minsho[1]):
-            mask[idx, jdx] = False
+    mask[_undersized(linked, idim, jdim, minsho)[linked]] = False
 
     return xr.DataArray(
         mask.T.astype(bool),
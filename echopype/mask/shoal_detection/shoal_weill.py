@@ -2,6 +2,27 @@ import numpy as np
 import scipy.ndimage as ndi
 import xarray as xr
 
+from echopype.mask.shoal_detection.utils import _undersized
+
+
+def _fill_short_gaps(mask: np.ndarray, maxgap: int, axis: int) -> None:
+    """
+    Fill in place every run of False along `axis` that is at most `maxgap` long,
+    unless the run touches either end of that axis.
+    """
+    # Label gaps with connectivity along `axis` only, so each label is a 1-D run
+    structure = np.zeros((3, 3), dtype=bool)
+    structure[(slice(None), 1) if axis == 0 else (1, slice(None))] = True
+    gaps, n_gaps = ndi.label(~mask, structure=structure)
+    if n_gaps == 0:
+        return
+
+    fill = np.bincount(gaps.ravel(), minlength=n_gaps + 1) <= maxgap
+    fill[0] = False
+    # Do not fill gaps touching the boundaries
+    fill[np.take(gaps, [0, -1], axis=axis)] = False
+    mask[fill[gaps]] = True
+
 
 def shoal_weill(
     ds: xr.Dataset,
@@ -89,57 +110,21 @@ def shoal_weill(
     if np.isscalar(mask):
         mask = np.zeros_like(Sv, dtype=bool)
 
-    n_range, n_ping = mask.shape
-
     # --- 2) Fill short vertical gaps per ping
-    # Work on each column (over range axis)
-    for jdx in range(n_ping):
-        col = mask[:, jdx]
-        # Label False regions (gaps) within the True mask
-        labelled = ndi.label(~col)[0]
-        # If all False or all True, nothing to do
-        if (labelled == 0).all() or (labelled == 1).all():
-            continue
-        for lab in range(1, labelled.max() + 1):
-            gap = labelled == lab
-            gap_size = int(gap.sum())
-            if gap_size <= maxvgap:
-                idx = np.where(gap)[0]
-                # Do not fill if the gap touches top/bottom boundary
-                if 0 in idx or (n_range - 1) in idx:
-                    continue
-                mask[idx, jdx] = True
+    # All columns (over range axis) at once
+    _fill_short_gaps(mask, maxvgap, axis=0)
 
     # --- 3) Fill short horizontal gaps per depth
-    # Work on each row (over ping axis)
-    for idx in range(n_range):
-        row = mask[idx, :]
-        labelled = ndi.label(~row)[0]
-        if (labelled == 0).all() or (labelled == 1).all():
-            continue
-        for lab in range(1, labelled.max() + 1):
-            gap = labelled == lab
-            gap_size = int(gap.sum())
-            if gap_size <= maxhgap:
-                jdxs = np.where(gap)[0]
-                # Do not fill if the gap touches left/right boundary
-                if 0 in jdxs or (n_ping - 1) in jdxs:
-                    continue
-                mask[idx, jdxs] = True
+    # All rows (over ping axis) at once
+    _fill_short_gaps(mask, maxhgap, axis=1)
 
     # --- 4) Remove features smaller than (minvlen, minhlen)
     # Label True regions and filter by size in (range, ping) coordinates
     features = ndi.label(mask)[0]
-    if features.max() > 0:
-        for lab in range(1, features.max() + 1):
-            feat = features == lab
-            if not feat.any():
-                continue
-            ii, jj = np.where(feat)
-            vlen = int(ii.max() - ii.min() + 1)  # vertical length in samples
-            hlen = int(jj.max() - jj.min() + 1)  # horizontal length in pings
-            if (vlen < minvlen) or (hlen < minhlen):
-                mask[ii, jj] = False
+    n_range, n_ping = mask.shape
+    # Edges in samples/pings, so box sizes are lengths in (range, ping) index units
+    small = _undersized(features, np.arange(n_range + 1), np.arange(n_ping + 1), (minvlen, minhlen))
+    mask[small[features]] = False
 
     # Return as (ping_time, range_sample) to match echopype convention
     out = xr.DataArray(
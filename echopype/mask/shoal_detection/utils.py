@@ -0,0 +1,30 @@
+import numpy as np
+import scipy.ndimage as ndi
+
+
+def _undersized(
+    labelled: np.ndarray, idim: np.ndarray, jdim: np.ndarray, min_size: tuple[float, float]
+) -> np.ndarray:
+    """
+    Lookup table indexed by label value: True where the bounding box of that
+    object is smaller than `min_size` (height, width) in idim/jdim units.
+
+    `idim` and `jdim` are the row and column edges (one more than the number of
+    rows/columns); pass ``np.arange(n + 1)`` to measure in samples/pings.
+    """
+    boxes = ndi.find_objects(labelled)
+    labels = np.array([lab for lab, box in enumerate(boxes, start=1) if box is not None], dtype=int)
+    rows = [boxes[lab - 1][0] for lab in labels]
+    cols = [boxes[lab - 1][1] for lab in labels]
+    height = (
+        idim[np.array([r.stop for r in rows], dtype=int)]
+        - idim[np.array([r.start for r in rows], dtype=int)]
+    )
+    width = (
+        jdim[np.array([c.stop for c in cols], dtype=int)]
+        - jdim[np.array([c.start for c in cols], dtype=int)]
+    )
+
+    undersized = np.zeros(len(boxes) + 1, dtype=bool)
+    undersized[labels] = (height < min_size[0]) | (width < min_size[1])
+    return undersized
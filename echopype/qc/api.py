@@ -16,13 +16,13 @@ def _clean_reversed(time_old: np.ndarray, win_len: int):
     neg_idx = np.argwhere(time_old_diff < np.timedelta64(0, "ns")).flatten()
 
     # substitute out the reversed timestamp using the previous one
-    new_diff = []
-    for ni in neg_idx:
+    new_diff = np.empty(neg_idx.size, dtype=time_old_diff.dtype)
+    for i, ni in enumerate(neg_idx):
         local_win_idx = ni + np.arange(-win_len, 0)
         if local_win_idx[0] < 0:
             first_valid_idx = np.argwhere(local_win_idx == 0).flatten()[0]
             local_win_idx = local_win_idx[first_valid_idx:]
-        new_diff.append(np.median(time_old_diff[local_win_idx]))
+        new_diff[i] = np.median(time_old_diff[local_win_idx])
     time_old_diff[neg_idx] = new_diff
 
     # perform cumulative sum of differences after 1st neg index
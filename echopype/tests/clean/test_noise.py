@@ -10,6 +10,7 @@ from echopype.clean.utils import (
     index_binning_pool_Sv,
     index_binning_downsample_upsample_along_depth,
     downsample_upsample_along_depth,
+    echopy_attenuated_signal_mask,
 )
 from echopype.utils.compute import _lin2log, _log2lin
 
@@ -862,6 +863,16 @@ def test_mask_attenuated_signal_against_echopy(chunk, ek60_path):
     )
 
 
+@pytest.mark.unit
+def test_echopy_attenuated_signal_mask_no_pings():
+    """Test `echopy_attenuated_signal_mask` returns an empty mask when there are no pings."""
+    Sv = np.empty((0, 10))
+    range_var = np.empty((0, 10))
+    attenuated_mask = echopy_attenuated_signal_mask(Sv, range_var, 2.0, 8.0, 3, -6.0)
+    assert attenuated_mask.shape == (0, 10)
+    assert attenuated_mask.dtype == bool
+
+
 @pytest.mark.unit
 def test_estimate_background_noise_upsampling(ek60_path):
     """Test for the correct upsampling behavior in `estimate_background_noise`"""
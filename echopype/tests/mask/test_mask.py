@@ -2037,3 +2037,34 @@ def test_echoview_mincan_no_linking():
     # Label the mask and confirm they are separate components (not connected)
     _, nlab = ndi.label(mask.values, structure=np.ones((3, 3), dtype=bool))
     assert nlab == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "source",
+    [
+        np.arange(11) * 0.5,  # uniform, exact ties at midpoints
+        np.array([0.0, 0.2, 1.0, 1.1, 3.0, 7.5]),  # non-uniform, increasing
+        np.array([2.0, 0.0, 1.0, 5.0, 3.0]),  # unsorted
+    ],
+)
+def test_echoview_nearest_index_matches_argmin(source):
+    """
+    Test that `_nearest_index` returns the index of the nearest source value,
+    with the smaller value chosen on ties.
+    """
+    from echopype.utils.compute import _nearest_index
+
+    target = np.concatenate(
+        [
+            np.linspace(source.min() - 2, source.max() + 2, 57),
+            source,
+            (source[:-1] + source[1:]) / 2,
+        ]
+    )
+
+    # Brute force on the sorted source, where argmin picks the smaller value on ties
+    order = np.argsort(source, kind="stable")
+    expected = order[[np.argmin(abs(source[order] - t)) for t in target]]
+
+    np.testing.assert_array_equal(_nearest_index(source, target), expected)
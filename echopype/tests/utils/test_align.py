@@ -240,6 +240,62 @@ def test_align_to_ping_time_values_when_matching_time_values():
     expected_aligned_da.equals(aligned_da)
 
 
+@pytest.mark.unit
+def test_align_to_ping_time_nearest_matches_interp():
+    """
+    Test that 'nearest' `align_to_ping_time` matches xarray's nearest interpolation
+    on unsorted external times, ties, and ping times outside the external time span,
+    and that invalid (NaT or duplicate) external times are rejected.
+    """
+    # Create unsorted external DataArray and ping times with ties and extrapolation
+    external_da = xr.DataArray(
+        [3, 0, 2, 1],
+        coords={
+            "time1": np.array(
+                ["2017-06-20T01:40:00", "2017-06-20T01:10:00", "2017-06-20T01:30:00", "2017-06-20T01:20:00"],  # noqa: E501
+                dtype="datetime64[ns]"
+            )
+        },
+        dims=["time1"]
+    )
+    ping_time_da = xr.DataArray(
+        np.array(
+            ["2017-06-20T01:00:00", "2017-06-20T01:15:00", "2017-06-20T01:26:00", "2017-06-20T01:50:00"],  # noqa: E501
+            dtype="datetime64[ns]"
+        ),
+        dims=["ping_time"],
+        name="ping_time",
+    )
+
+    # Align external DataArray
+    aligned_da = align_to_ping_time(external_da, "time1", ping_time_da, method="nearest")
+
+    # Check against interpolation
+    expected_aligned_da = external_da.interp(
+        {"time1": ping_time_da},
+        method="nearest",
+        kwargs={"fill_value": "extrapolate"},
+    ).drop_vars("time1")
+    assert np.array_equal(aligned_da.values, [0.0, 0.0, 2.0, 3.0])
+    xr.testing.assert_identical(aligned_da, expected_aligned_da)
+
+    # NaT in external times
+    nat_times = external_da["time1"].values.copy()
+    nat_times[0] = np.datetime64("NaT", "ns")
+    with pytest.raises(ValueError, match="NaT"):
+        align_to_ping_time(
+            external_da.assign_coords(time1=nat_times), "time1", ping_time_da, method="nearest"
+        )
+
+    # Duplicate external times
+    dup_times = external_da["time1"].values.copy()
+    dup_times[0] = dup_times[1]
+    with pytest.raises(ValueError, match="duplicate"):
+        align_to_ping_time(
+            external_da.assign_coords(time1=dup_times), "time1", ping_time_da, method="nearest"
+        )
+
+
 @pytest.mark.integration
 def test_align_to_ping_time_glider_azfp(azfp_path):
     """
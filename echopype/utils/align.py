@@ -1,6 +1,8 @@
 import numpy as np
 import xarray as xr
 
+from .compute import _nearest_index
+
 
 def align_to_ping_time(
     external_da: xr.DataArray,
@@ -51,6 +53,21 @@ def align_to_ping_time(
             coords={"ping_time": ping_time_da.values},
             attrs=external_da.attrs,
         )
+    elif method == "nearest":
+        # Nearest-neighbour lookup by index; no interpolator needs to be built
+        external_times = external_da[external_time_name].to_index()
+        if external_times.hasnans:
+            raise ValueError(f"External time '{external_time_name}' contains NaT values")
+        if not external_times.is_unique:
+            raise ValueError(f"External time '{external_time_name}' contains duplicate values")
+        idx = ping_time_da.copy(
+            data=_nearest_index(external_da[external_time_name].values, ping_time_da.values)
+        )
+        aligned_da = external_da.isel({external_time_name: idx}).drop_vars(external_time_name)
+        if aligned_da.dtype.kind in "iu":
+            # Integer data comes out of `interp` as float
+            aligned_da = aligned_da.astype(np.float64)
+        return aligned_da
     else:
         return external_da.interp(
             {external_time_name: ping_time_da},
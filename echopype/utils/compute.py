@@ -40,3 +40,35 @@ def _lin2log(data: Union[dask.array.Array, np.ndarray]) -> Union[dask.array.Arra
         The transformed data
     """
     return 10 * np.log10(data)
+
+
+def _nearest_index(source: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """Find the index of the nearest `source` value for each `target` value
+
+    Targets outside the `source` span map to its first or last element, and
+    ties go to the smaller `source` value. `source` may be unsorted but must
+    not contain NaN/NaT.
+
+    Parameters
+    ----------
+    source : np.ndarray
+        1-D numeric or datetime64 values to search in
+    target : np.ndarray
+        Values to look up, of the same kind as `source`
+
+    Returns
+    -------
+    np.ndarray
+        Integer indices into `source`, one per `target` value
+    """
+    if np.issubdtype(source.dtype, np.datetime64):
+        # Exact integer nanosecond differences
+        source = source.astype("datetime64[ns]").view(np.int64)
+        target = target.astype("datetime64[ns]").view(np.int64)
+    order = np.argsort(source, kind="stable")
+    source = source[order]
+
+    right = np.clip(np.searchsorted(source, target), 1, len(source) - 1)
+    left = right - 1
+    nearest = np.where(target - source[left] <= source[right] - target, left, right)
+    return order[nearest]